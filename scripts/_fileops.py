@@ -0,0 +1,196 @@
+"""
+Shared file operations for the harvest and forge scripts.
+
+Both scripts walk directory trees and bulk-copy files the same way, so the
+scandir walker, the metadata-preserving copy and the memoized mkdir /
+thread pool copy machinery live here. The scripts import this module
+directly, since scripts/ is on sys.path when they are run.
+"""
+
+import argparse
+import os
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Set, Tuple, Union
+
+# Copies are I/O bound, so oversubscribe the CPUs (same cap as ThreadPoolExecutor)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be an integer of at least 1.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def copy_with_stat(entry: os.DirEntry, dest_file: str) -> None:
+    """
+    Copy a walked file with its timestamps and permission bits, like shutil.copy2.
+
+    The DirEntry itself is handed to shutil.copyfile, which then uses its
+    cached stat() instead of stat-ing the source again (bpo-33695), and
+    the same cached result feeds utime/chmod instead of copystat's own
+    stat. Extended attributes and file flags are not copied.
+
+    Args:
+        entry: Directory entry of the source file
+        dest_file: Destination path
+    """
+    source_stat = entry.stat()
+    shutil.copyfile(entry, dest_file)
+    os.utime(dest_file, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    os.chmod(dest_file, stat.S_IMODE(source_stat.st_mode))
+
+
+def iter_files(root: str, suffix: Optional[str] = None) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Recursively yield files under a directory using os.scandir.
+
+    Directory entries carry their file type, so regular files and
+    directories are classified without an extra stat call per entry.
+    Symlinked directories are not descended into (same as Path.rglob).
+
+    Args:
+        root: Directory to walk
+        suffix: Optional filename suffix to filter on (e.g. ".md")
+
+    Yields:
+        Tuples of (directory entry, path relative to root); the entry keeps
+        its stat() result cached for metadata-preserving copies
+    """
+    # Relative paths are sliced off entry.path instead of built with
+    # relative_to(); scandir adds no separator after a root that ends in one
+    prefix_len = len(root.rstrip(os.sep + (os.altsep or ""))) + 1
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file() and (suffix is None or entry.name.endswith(suffix)):
+                    yield entry, entry.path[prefix_len:]
+
+
+class FileCopier:
+    """Memoized directory creation and parallel bulk copies for Harvester and ProjectForge."""
+
+    def __init__(
+        self,
+        copy_entry: Callable[[os.DirEntry, str], None],
+        jobs: Optional[int] = None,
+        verbose: bool = False,
+    ):
+        """
+        Initialize copy settings.
+
+        Args:
+            copy_entry: Copies one walked file to a destination path, e.g.
+                shutil.copyfile or copy_with_stat to keep metadata
+            jobs: Optional number of parallel copy workers (default: 4x CPU count, max 32)
+            verbose: Whether to print every copied file instead of a summary
+
+        Raises:
+            ValueError: If jobs is less than 1
+        """
+        if jobs is not None and jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+        self._copy_entry = copy_entry
+        self.jobs = DEFAULT_JOBS if jobs is None else jobs
+        self.verbose = verbose
+        self._created_dirs: Set[str] = set()
+        self._shared_pool: Optional[ThreadPoolExecutor] = None
+
+    def _ensure_dir(self, directory: Union[str, Path]) -> None:
+        """
+        Create a directory and its parents, skipping ones already created.
+
+        Every ancestor is remembered too, so nested destinations cost one
+        mkdir per unique directory instead of one per copied file.
+
+        Args:
+            directory: Directory to create
+        """
+        directory = os.fspath(directory)
+        if directory in self._created_dirs:
+            return
+        os.makedirs(directory, exist_ok=True)
+        while directory not in self._created_dirs:
+            self._created_dirs.add(directory)
+            directory = os.path.dirname(directory)
+
+    @contextmanager
+    def _sharing_copy_pool(self) -> Iterator[None]:
+        """
+        Route every _copy_files call through one thread pool for the block.
+
+        Used while several copy steps run concurrently: the single pool
+        keeps the total number of copy threads at self.jobs, and the
+        progress counters are off because concurrent steps would draw
+        over each other's line.
+        """
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            self._shared_pool = pool
+            try:
+                yield
+            finally:
+                self._shared_pool = None
+
+    def _copy_files(self, pairs: List[Tuple[os.DirEntry, str]]) -> None:
+        """
+        Copy (source, destination) pairs, on a thread pool when it helps.
+
+        Paths are plain strings so the per-file work never builds Path
+        objects. Destination directories are created up front so the
+        workers never race on mkdir; the copy releases the GIL
+        while it runs.
+
+        Args:
+            pairs: Source file entries and the destinations to copy them to
+        """
+        # Deepest first: one makedirs creates all the ancestors, so parents
+        # that also hold files are then already in the _ensure_dir cache
+        parents = {os.path.dirname(dest_file) for _, dest_file in pairs}
+        for parent in sorted(parents, key=len, reverse=True):
+            self._ensure_dir(parent)
+
+        # Verbose mode lists every file afterwards; otherwise show a counter
+        # that only touches stdout once per 1024 files. Carriage returns are
+        # only useful on a terminal, so piped output gets no counter at all,
+        # and neither do concurrent steps sharing a pool.
+        pool = self._shared_pool
+        show_progress = not self.verbose and pool is None and sys.stdout.isatty()
+
+        with ExitStack() as stack:
+            # Without a shared pool, one worker or one file has nothing to
+            # overlap, so copy serially in this thread like shutil.copytree
+            if pool is None and self.jobs > 1 and len(pairs) > 1:
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=self.jobs))
+            copy_map = map if pool is None else pool.map
+            for copied, _ in enumerate(copy_map(lambda pair: self._copy_entry(*pair), pairs), 1):
+                if show_progress and not copied & 1023:
+                    sys.stdout.write(f"\r   copied {copied}")
+                    sys.stdout.flush()
+
+        if show_progress and len(pairs) > 1023:
+            sys.stdout.write("\r" + " " * 40 + "\r")
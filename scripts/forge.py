@@ -7,16 +7,134 @@ Claude Code configurations, commands, and documentation.
 """
 
 import argparse
+import os
 import shutil
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 import json
 
+from _fileops import FileCopier, copy_with_stat, iter_files, positive_int
+
+# Repository root (templates/ and ai_docs_sources/ live here), resolved once
+_FORGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Standard Claude Code .gitignore entries, encoded once at import
+_CLAUDE_GITIGNORE_BLOB = "\n".join([
+    "# Claude Code",
+    ".claude/settings.local.json",
+    ".mcp.local.json",
+    "",
+    "# Python",
+    "__pycache__/",
+    "*.py[cod]",
+    "*$py.class",
+    "*.so",
+    ".Python",
+    "venv/",
+    "venv_linux/",
+    "ENV/",
+    "env/",
+    ".venv",
+    "",
+    "# IDEs",
+    ".vscode/",
+    ".idea/",
+    "*.swp",
+    "*.swo",
+    "*~",
+    "",
+    "# OS",
+    ".DS_Store",
+    "Thumbs.db",
+    "",
+]).encode("utf-8")
+
+# README.md skeleton for new projects, filled in with str.format()
+_README_TEMPLATE = """# {project_name}
+
+Project created with claude-project-forge using the `{template_name}` template.
 
-class ProjectForge:
+## Getting Started
+
+1. Review and customize `CLAUDE.md` for project-specific guidelines
+2. Explore available commands in `.claude/commands/`
+3. Configure MCP servers if needed (see `.mcp.json`)
+4. Check `ai_docs/` for reference documentation
+
+## Development
+
+[Add your development instructions here]
+
+## Testing
+
+[Add your testing instructions here]
+
+## License
+
+[Add your license here]
+"""
+
+
+@lru_cache(maxsize=4096)
+def _dir_exists(path: str) -> bool:
+    """
+    Check whether a directory exists, remembering the answer.
+
+    Only used for ai_docs_sources, which does not change while a project
+    is being forged; ProjectForge.forge() clears the cache on entry.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if path is an existing directory
+    """
+    return os.path.isdir(path)
+
+
+def _count_files(root: str) -> int:
+    """
+    Count files under a directory without stat-ing each entry.
+
+    os.walk is scandir-based and already splits names into directories
+    and files, so only the per-directory lengths need adding up.
+
+    Args:
+        root: Directory to count
+
+    Returns:
+        Number of files below root (symlinked directories are not followed)
+    """
+    return sum(len(files) for _, _, files in os.walk(root, followlinks=False))
+
+
+def _plural_files(count: int) -> str:
+    """
+    Format a copied-file count for the summary lines.
+
+    Args:
+        count: Number of files
+
+    Returns:
+        "1 file" or "<count> files"
+    """
+    return f"{count} file" if count == 1 else f"{count} files"
+
+
+class ProjectForge(FileCopier):
     """Create new projects from Claude Code templates."""
 
-    def __init__(self, project_name: str, template_name: str, destination: Optional[Path] = None):
+    def __init__(
+        self,
+        project_name: str,
+        template_name: str,
+        destination: Optional[Path] = None,
+        jobs: Optional[int] = None,
+        preserve_metadata: bool = False,
+        verbose: bool = False,
+    ):
         """
         Initialize project forge.
 
@@ -24,10 +142,18 @@ class ProjectForge:
             project_name: Name of the new project
             template_name: Name of the template to use
             destination: Optional destination directory (default: current directory)
+            jobs: Optional number of parallel copy workers (default: 4x CPU count, max 32)
+            preserve_metadata: Whether to copy file timestamps and permissions
+            verbose: Whether to print every copied file instead of a summary
         """
+        # copyfile takes the platform fast path (sendfile / CopyFile2) and
+        # skips the chmod + utime that copy2 does for every file
+        _copy = copy_with_stat if preserve_metadata else shutil.copyfile
+        super().__init__(_copy, jobs, verbose)
         self.project_name = project_name
         self.template_name = template_name
-        self.forge_root = Path(__file__).parent.parent
+        self.preserve_metadata = preserve_metadata
+        self.forge_root = _FORGE_ROOT
         self.template_dir = self.forge_root / "templates" / template_name
         self.ai_docs_dir = self.forge_root / "ai_docs_sources"
 
@@ -36,11 +162,14 @@ class ProjectForge:
         else:
             self.dest = Path.cwd() / project_name
 
-        if not self.template_dir.exists():
+        # One stat up front; the destination check happens atomically in forge()
+        try:
+            self._template_stat = os.stat(self.template_dir)
+        except FileNotFoundError:
             raise ValueError(f"Template does not exist: {template_name}")
 
-        if self.dest.exists():
-            raise ValueError(f"Project directory already exists: {self.dest}")
+        if not stat.S_ISDIR(self._template_stat.st_mode):
+            raise ValueError(f"Template is not a directory: {template_name}")
 
     def copy_template_files(self) -> int:
         """
@@ -51,17 +180,19 @@ class ProjectForge:
         """
         print(f"\n📋 Copying template files...")
 
-        copied = 0
-        for item in self.template_dir.rglob("*"):
-            if item.is_file():
-                relative_path = item.relative_to(self.template_dir)
-                dest_file = self.dest / relative_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dest_file)
+        dest_root = str(self.dest)
+        files = list(iter_files(str(self.template_dir)))
+        self._copy_files([
+            (item, os.path.join(dest_root, relative_path))
+            for item, relative_path in files
+        ])
+        if self.verbose:
+            for _, relative_path in files:
                 print(f"   ✅ {relative_path}")
-                copied += 1
+        else:
+            print(f"   ✅ {_plural_files(len(files))}")
 
-        return copied
+        return len(files)
 
     def copy_ai_docs(self, doc_categories: Optional[List[str]] = None) -> int:
         """
@@ -73,12 +204,12 @@ class ProjectForge:
         Returns:
             Number of files copied
         """
-        if not self.ai_docs_dir.exists():
+        if not _dir_exists(str(self.ai_docs_dir)):
             print(f"⚠️  No AI docs sources found")
             return 0
 
-        dest_ai_docs = self.dest / "ai_docs"
-        dest_ai_docs.mkdir(parents=True, exist_ok=True)
+        dest_ai_docs = os.path.join(self.dest, "ai_docs")
+        self._ensure_dir(dest_ai_docs)
 
         print(f"\n📚 Copying AI documentation...")
 
@@ -87,25 +218,34 @@ class ProjectForge:
             # Copy specific categories
             for category in doc_categories:
                 source_dir = self.ai_docs_dir / category
-                if source_dir.exists():
-                    for doc_file in source_dir.rglob("*.md"):
-                        relative_path = doc_file.relative_to(source_dir)
-                        dest_file = dest_ai_docs / category / relative_path
-                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(doc_file, dest_file)
-                        print(f"   ✅ {category}/{relative_path}")
-                        copied += 1
+                if _dir_exists(str(source_dir)):
+                    dest_category = os.path.join(dest_ai_docs, category)
+                    files = list(iter_files(str(source_dir), ".md"))
+                    self._copy_files([
+                        (doc_file, os.path.join(dest_category, relative_path))
+                        for doc_file, relative_path in files
+                    ])
+                    if self.verbose:
+                        for _, relative_path in files:
+                            print(f"   ✅ {category}/{relative_path}")
+                    else:
+                        print(f"   ✅ {category}: {_plural_files(len(files))}")
+                    copied += len(files)
                 else:
                     print(f"   ⚠️  Category not found: {category}")
         else:
             # Copy all AI docs
-            for doc_file in self.ai_docs_dir.rglob("*.md"):
-                relative_path = doc_file.relative_to(self.ai_docs_dir)
-                dest_file = dest_ai_docs / relative_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(doc_file, dest_file)
-                print(f"   ✅ {relative_path}")
-                copied += 1
+            files = list(iter_files(str(self.ai_docs_dir), ".md"))
+            self._copy_files([
+                (doc_file, os.path.join(dest_ai_docs, relative_path))
+                for doc_file, relative_path in files
+            ])
+            if self.verbose:
+                for _, relative_path in files:
+                    print(f"   ✅ {relative_path}")
+            else:
+                print(f"   ✅ {_plural_files(len(files))}")
+            copied = len(files)
 
         return copied
 
@@ -122,54 +262,23 @@ class ProjectForge:
         print(f"\n📁 Creating project structure...")
         for dir_name in dirs_to_create:
             dir_path = self.dest / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(dir_path)
             print(f"   ✅ {dir_name}/")
 
     def create_gitignore(self) -> None:
         """Create or append to .gitignore with Claude Code specific entries."""
         gitignore_path = self.dest / ".gitignore"
 
-        # Standard Claude Code entries
-        claude_entries = [
-            "# Claude Code",
-            ".claude/settings.local.json",
-            ".mcp.local.json",
-            "",
-            "# Python",
-            "__pycache__/",
-            "*.py[cod]",
-            "*$py.class",
-            "*.so",
-            ".Python",
-            "venv/",
-            "venv_linux/",
-            "ENV/",
-            "env/",
-            ".venv",
-            "",
-            "# IDEs",
-            ".vscode/",
-            ".idea/",
-            "*.swp",
-            "*.swo",
-            "*~",
-            "",
-            "# OS",
-            ".DS_Store",
-            "Thumbs.db",
-            "",
-        ]
-
-        if gitignore_path.exists():
-            # Append if not already present
-            existing_content = gitignore_path.read_text()
-            if "# Claude Code" not in existing_content:
-                with gitignore_path.open("a") as f:
-                    f.write("\n" + "\n".join(claude_entries))
+        with gitignore_path.open("a+b") as gitignore:
+            # Append mode always writes at the end, so read from the start first
+            gitignore.seek(0)
+            existing_content = gitignore.read()
+            if not existing_content:
+                gitignore.write(_CLAUDE_GITIGNORE_BLOB)
+                print(f"   ✅ Created .gitignore")
+            elif b"# Claude Code" not in existing_content:
+                gitignore.write(b"\n" + _CLAUDE_GITIGNORE_BLOB)
                 print(f"   ✅ Updated .gitignore")
-        else:
-            gitignore_path.write_text("\n".join(claude_entries))
-            print(f"   ✅ Created .gitignore")
 
     def create_readme(self) -> None:
         """Create a basic README.md for the new project."""
@@ -179,31 +288,12 @@ class ProjectForge:
             print(f"   ⚠️  README.md already exists, skipping")
             return
 
-        readme_content = f"""# {self.project_name}
-
-Project created with claude-project-forge using the `{self.template_name}` template.
-
-## Getting Started
-
-1. Review and customize `CLAUDE.md` for project-specific guidelines
-2. Explore available commands in `.claude/commands/`
-3. Configure MCP servers if needed (see `.mcp.json`)
-4. Check `ai_docs/` for reference documentation
-
-## Development
-
-[Add your development instructions here]
-
-## Testing
-
-[Add your testing instructions here]
-
-## License
-
-[Add your license here]
-"""
-
-        readme_path.write_text(readme_content)
+        readme_path.write_text(
+            _README_TEMPLATE.format(
+                project_name=self.project_name,
+                template_name=self.template_name,
+            )
+        )
         print(f"   ✅ Created README.md")
 
     def forge(
@@ -223,12 +313,19 @@ Project created with claude-project-forge using the `{self.template_name}` templ
         Returns:
             Dictionary with counts of what was created
         """
+        # ai_docs_sources may have changed since an earlier forge in this process
+        _dir_exists.cache_clear()
+
         print(f"\n🔨 Forging project: {self.project_name}")
         print(f"📦 Template: {self.template_name}")
         print(f"📍 Location: {self.dest}\n")
 
-        # Create project directory
-        self.dest.mkdir(parents=True, exist_ok=True)
+        # Create project directory, refusing to reuse an existing one
+        try:
+            self.dest.mkdir(parents=True)
+        except FileExistsError:
+            raise ValueError(f"Project directory already exists: {self.dest}")
+        self._created_dirs.add(str(self.dest))
 
         results = {
             "template_files": self.copy_template_files(),
@@ -260,8 +357,7 @@ Project created with claude-project-forge using the `{self.template_name}` templ
 
 def list_templates():
     """List all available templates."""
-    forge_root = Path(__file__).parent.parent
-    templates_dir = forge_root / "templates"
+    templates_dir = _FORGE_ROOT / "templates"
 
     if not templates_dir.exists():
         print("No templates found.")
@@ -271,7 +367,7 @@ def list_templates():
     for template_dir in sorted(templates_dir.iterdir()):
         if template_dir.is_dir():
             # Count files in template
-            file_count = sum(1 for _ in template_dir.rglob("*") if _.is_file())
+            file_count = _count_files(str(template_dir))
             print(f"   • {template_dir.name} ({file_count} files)")
     print()
 
@@ -313,6 +409,23 @@ def main():
         nargs="+",
         help="Additional directories to create (default: src tests docs)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        help="Number of parallel copy workers (default: 4x CPU count, max 32)",
+    )
+    parser.add_argument(
+        "--preserve-metadata",
+        action="store_true",
+        help="Preserve file timestamps and permissions when copying (slower)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Print every copied file instead of a summary",
+    )
 
     args = parser.parse_args()
 
@@ -330,6 +443,9 @@ def main():
             args.project_name,
             args.template,
             args.destination,
+            args.jobs,
+            args.preserve_metadata,
+            args.verbose,
         )
 
         forge.forge(
@@ -7,42 +7,132 @@ from your existing projects to build reusable templates.
 """
 
 import argparse
+import errno
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from _fileops import FileCopier, copy_with_stat, iter_files, positive_int
 
-class Harvester:
+# Repository root (templates/ and ai_docs_sources/ live here), resolved once
+_FORGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Single files harvested as-is: (results key, path relative to project/template root)
+_SIMPLE_ASSETS = [
+    ("claude_md", "CLAUDE.md"),
+    ("settings", os.path.join(".claude", "settings.local.json")),
+    ("mcp_config", ".mcp.json"),
+    ("gitignore", ".gitignore"),
+]
+
+# Errors that mean "no such asset": the errnos Path.exists() maps to False
+# (e.g. .claude being a regular file gives ENOTDIR), plus a directory
+# sitting where the file should be
+_MISSING_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.ELOOP, errno.EISDIR}
+
+
+class Harvester(FileCopier):
     """Harvest Claude Code assets from existing projects."""
 
-    def __init__(self, source_project: Path, template_name: str):
+    def __init__(
+        self,
+        source_project: Path,
+        template_name: str,
+        jobs: Optional[int] = None,
+        verbose: bool = False,
+    ):
         """
         Initialize harvester.
 
         Args:
             source_project: Path to the source project to harvest from
             template_name: Name of the template to create/update
+            jobs: Optional number of parallel copy workers (default: 4x CPU count, max 32)
+            verbose: Whether to print every copied file instead of a summary
         """
+        super().__init__(copy_with_stat, jobs, verbose)
+        self._step_output = threading.local()
         self.source = Path(source_project).resolve()
-        self.forge_root = Path(__file__).parent.parent
+        self.forge_root = _FORGE_ROOT
         self.template_dir = self.forge_root / "templates" / template_name
         self.ai_docs_dir = self.forge_root / "ai_docs_sources"
 
         if not self.source.exists():
             raise ValueError(f"Source project does not exist: {self.source}")
 
-    def harvest_claude_md(self) -> bool:
-        """Copy CLAUDE.md file if it exists."""
-        source_file = self.source / "CLAUDE.md"
-        if source_file.exists():
-            dest = self.template_dir / "CLAUDE.md"
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, dest)
-            print(f"✅ Copied CLAUDE.md")
-            return True
+    def _log(self, message: str) -> None:
+        """
+        Print a harvest message, or hold it while the steps run concurrently.
+
+        Args:
+            message: Line to print
+        """
+        lines = getattr(self._step_output, "lines", None)
+        if lines is None:
+            print(message)
         else:
-            print(f"⚠️  No CLAUDE.md found")
-            return False
+            lines.append(message)
+
+    def _run_step(self, step: Callable[[], Any], lines: List[str]) -> Any:
+        """
+        Run one harvest step in this thread, collecting its messages in lines.
+
+        Args:
+            step: Harvest method to run
+            lines: List that receives the step's messages
+
+        Returns:
+            The step's result
+        """
+        self._step_output.lines = lines
+        try:
+            return step()
+        finally:
+            self._step_output.lines = None
+
+    def _harvest_simple(self, keys: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Copy the single-file assets listed in _SIMPLE_ASSETS.
+
+        A missing source is detected by opening it (EAFP) instead of a
+        separate exists() check, and the destination directory is only
+        created once the source has been read, so missing assets leave
+        nothing behind in the template. The files are tiny, so a plain
+        read + write beats shutil.copy2 and its chmod/utime calls.
+
+        Args:
+            keys: Optional subset of _SIMPLE_ASSETS keys to copy (default: all)
+
+        Returns:
+            Dictionary mapping each asset key to whether it was copied
+        """
+        results = {}
+        for key, relative_path in _SIMPLE_ASSETS:
+            if keys is not None and key not in keys:
+                continue
+
+            file_name = os.path.basename(relative_path)
+            try:
+                with open(os.path.join(self.source, relative_path), "rb") as source_file:
+                    data = source_file.read()
+            except OSError as error:
+                if error.errno not in _MISSING_ERRNOS:
+                    raise
+                self._log(f"⚠️  No {file_name} found")
+                results[key] = False
+            else:
+                dest = os.path.join(self.template_dir, relative_path)
+                self._ensure_dir(os.path.dirname(dest))
+                with open(dest, "wb") as dest_file:
+                    dest_file.write(data)
+                self._log(f"✅ Copied {file_name}")
+                results[key] = True
+
+        return results
 
     def harvest_commands(self, command_names: Optional[List[str]] = None) -> int:
         """
@@ -56,11 +146,11 @@ class Harvester:
         """
         source_commands = self.source / ".claude" / "commands"
         if not source_commands.exists():
-            print(f"⚠️  No .claude/commands/ directory found")
+            self._log(f"⚠️  No .claude/commands/ directory found")
             return 0
 
         dest_commands = self.template_dir / ".claude" / "commands"
-        dest_commands.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dest_commands)
 
         copied = 0
         if command_names:
@@ -69,48 +159,27 @@ class Harvester:
                 source_file = source_commands / cmd_name
                 if source_file.exists():
                     shutil.copy2(source_file, dest_commands / cmd_name)
-                    print(f"✅ Copied command: {cmd_name}")
+                    self._log(f"✅ Copied command: {cmd_name}")
                     copied += 1
                 else:
-                    print(f"⚠️  Command not found: {cmd_name}")
+                    self._log(f"⚠️  Command not found: {cmd_name}")
         else:
             # Copy all commands
-            for cmd_file in source_commands.glob("**/*.md"):
-                relative_path = cmd_file.relative_to(source_commands)
-                dest_file = dest_commands / relative_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(cmd_file, dest_file)
-                print(f"✅ Copied command: {relative_path}")
-                copied += 1
+            dest_root = str(dest_commands)
+            files = list(iter_files(str(source_commands), ".md"))
+            self._copy_files([
+                (cmd_file, os.path.join(dest_root, relative_path))
+                for cmd_file, relative_path in files
+            ])
+            if self.verbose:
+                for _, relative_path in files:
+                    self._log(f"✅ Copied command: {relative_path}")
+            elif files:
+                self._log(f"✅ Copied commands: {len(files)}")
+            copied = len(files)
 
         return copied
 
-    def harvest_settings(self) -> bool:
-        """Copy .claude/settings.local.json if it exists."""
-        source_file = self.source / ".claude" / "settings.local.json"
-        if source_file.exists():
-            dest = self.template_dir / ".claude" / "settings.local.json"
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, dest)
-            print(f"✅ Copied settings.local.json")
-            return True
-        else:
-            print(f"⚠️  No settings.local.json found")
-            return False
-
-    def harvest_mcp_config(self) -> bool:
-        """Copy .mcp.json if it exists."""
-        source_file = self.source / ".mcp.json"
-        if source_file.exists():
-            dest = self.template_dir / ".mcp.json"
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, dest)
-            print(f"✅ Copied .mcp.json")
-            return True
-        else:
-            print(f"⚠️  No .mcp.json found")
-            return False
-
     def harvest_ai_docs(self, target_subdir: str = "general") -> int:
         """
         Copy AI documentation to ai_docs_sources.
@@ -121,67 +190,94 @@ class Harvester:
         Returns:
             Number of files copied
         """
-        # Common AI docs locations
+        # Common AI docs locations, in order of preference, as
+        # (top-level directory, optional subdirectory)
         possible_locations = [
-            self.source / "PRPs" / "ai_docs",
-            self.source / "ai_docs",
-            self.source / "docs" / "ai",
+            ("PRPs", "ai_docs"),
+            ("ai_docs", None),
+            ("docs", "ai"),
         ]
 
+        # List the project root once instead of probing every candidate;
+        # only subdirectories of top-level hits need an extra check
+        top_dirs = set()
+        with os.scandir(self.source) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        top_dirs.add(entry.name)
+                except OSError:
+                    # e.g. a symlink loop, which Path.is_dir() reports as False
+                    pass
+        folded_top_dirs = {name.lower() for name in top_dirs}
+
         source_dir = None
-        for loc in possible_locations:
-            if loc.exists():
+        for top_name, sub_name in possible_locations:
+            if top_name not in top_dirs:
+                # Only a differently-cased variant (e.g. "prps") was listed:
+                # let the filesystem decide, since on case-insensitive ones
+                # (macOS, Windows) "PRPs" resolves to it
+                if top_name.lower() not in folded_top_dirs:
+                    continue
+                if not os.path.isdir(os.path.join(self.source, top_name)):
+                    continue
+            loc = os.path.join(self.source, top_name)
+            if sub_name is None:
+                source_dir = loc
+                break
+            loc = os.path.join(loc, sub_name)
+            if os.path.isdir(loc):
                 source_dir = loc
                 break
 
         if not source_dir:
-            print(f"⚠️  No AI docs directory found")
+            self._log(f"⚠️  No AI docs directory found")
             return 0
 
         dest_dir = self.ai_docs_dir / target_subdir
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        copied = 0
-        for doc_file in source_dir.glob("**/*.md"):
-            relative_path = doc_file.relative_to(source_dir)
-            dest_file = dest_dir / relative_path
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(doc_file, dest_file)
-            print(f"✅ Copied AI doc: {relative_path}")
-            copied += 1
-
-        return copied
-
-    def harvest_gitignore(self) -> bool:
-        """Copy .gitignore if it exists."""
-        source_file = self.source / ".gitignore"
-        if source_file.exists():
-            dest = self.template_dir / ".gitignore"
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, dest)
-            print(f"✅ Copied .gitignore")
-            return True
-        else:
-            print(f"⚠️  No .gitignore found")
-            return False
+        self._ensure_dir(dest_dir)
+
+        dest_root = str(dest_dir)
+        files = list(iter_files(source_dir, ".md"))
+        self._copy_files([
+            (doc_file, os.path.join(dest_root, relative_path))
+            for doc_file, relative_path in files
+        ])
+        if self.verbose:
+            for _, relative_path in files:
+                self._log(f"✅ Copied AI doc: {relative_path}")
+        elif files:
+            self._log(f"✅ Copied AI docs: {len(files)}")
+
+        return len(files)
 
     def harvest_prp_templates(self) -> int:
         """Copy PRP templates if they exist."""
         source_dir = self.source / "PRPs" / "templates"
         if not source_dir.exists():
-            print(f"⚠️  No PRP templates found")
+            self._log(f"⚠️  No PRP templates found")
             return 0
 
         dest_dir = self.template_dir / "PRPs" / "templates"
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        copied = 0
-        for template_file in source_dir.glob("*.md"):
-            shutil.copy2(template_file, dest_dir / template_file.name)
-            print(f"✅ Copied PRP template: {template_file.name}")
-            copied += 1
-
-        return copied
+        self._ensure_dir(dest_dir)
+
+        # Templates are not nested, so a single scandir level is enough
+        with os.scandir(source_dir) as entries:
+            template_files = [
+                entry for entry in entries
+                if entry.is_file() and entry.name.endswith(".md")
+            ]
+        self._copy_files([
+            (template_file, os.path.join(dest_dir, template_file.name))
+            for template_file in template_files
+        ])
+        if self.verbose:
+            for template_file in template_files:
+                self._log(f"✅ Copied PRP template: {template_file.name}")
+        elif template_files:
+            self._log(f"✅ Copied PRP templates: {len(template_files)}")
+
+        return len(template_files)
 
     def harvest_all(self, include_ai_docs: bool = True, ai_docs_subdir: str = "general") -> dict:
         """
@@ -197,18 +293,35 @@ class Harvester:
         print(f"\n🌾 Harvesting from: {self.source.name}")
         print(f"📦 Template: {self.template_dir.name}\n")
 
-        results = {
-            "claude_md": self.harvest_claude_md(),
-            "commands": self.harvest_commands(),
-            "settings": self.harvest_settings(),
-            "mcp_config": self.harvest_mcp_config(),
-            "gitignore": self.harvest_gitignore(),
-            "prp_templates": self.harvest_prp_templates(),
-            "ai_docs": 0,
+        harvests = {
+            "simple": self._harvest_simple,
+            "commands": self.harvest_commands,
+            "prp_templates": self.harvest_prp_templates,
         }
-
         if include_ai_docs:
-            results["ai_docs"] = self.harvest_ai_docs(ai_docs_subdir)
+            harvests["ai_docs"] = partial(self.harvest_ai_docs, ai_docs_subdir)
+
+        # The steps are independent blocking file I/O, so run them in plain
+        # threads and let the slowest one bound the total time. Both pools
+        # are joined on exit even if a step fails, so no step is still
+        # copying when its pool shuts down; the bulk copies share one pool
+        # so --jobs bounds the total copy threads
+        outputs = {key: [] for key in harvests}
+        with self._sharing_copy_pool(), ThreadPoolExecutor(max_workers=len(harvests)) as steps:
+            futures = {
+                key: steps.submit(self._run_step, harvest, outputs[key])
+                for key, harvest in harvests.items()
+            }
+
+        # Messages were held back per step, so print them in a fixed order
+        # instead of letting concurrent print() calls split each other's lines
+        for lines in outputs.values():
+            for line in lines:
+                print(line)
+
+        results = dict(futures.pop("simple").result())
+        results.update((key, future.result()) for key, future in futures.items())
+        results.setdefault("ai_docs", 0)
 
         print(f"\n✨ Harvest complete!")
         print(f"   Commands: {results['commands']}")
@@ -249,18 +362,29 @@ def main():
         default="general",
         help="Subdirectory for AI docs in ai_docs_sources (default: general)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        help="Number of parallel copy workers (default: 4x CPU count, max 32)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Print every copied file instead of a summary",
+    )
 
     args = parser.parse_args()
 
     try:
-        harvester = Harvester(args.source, args.template)
+        harvester = Harvester(args.source, args.template, args.jobs, args.verbose)
 
         if args.commands:
             # Harvest specific items
             print(f"\n🌾 Harvesting specific items from: {harvester.source.name}\n")
-            harvester.harvest_claude_md()
+            harvester._harvest_simple(["claude_md", "settings"])
             harvester.harvest_commands(args.commands)
-            harvester.harvest_settings()
         else:
             # Harvest everything
             harvester.harvest_all(